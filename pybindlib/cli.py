@@ -4,20 +4,15 @@ Command-line interface for pybindlib.
 
 # Standard library imports
 import argparse
+import contextlib
+import io
 import os
 import sys
 
 # Local imports
-from .debug_info import (
-    QualityScore,
-    TypedefInfo,
-    collect_all_structures_and_typedefs,
-    load_library_and_debug_info,
-)
-from .generator import (
-    generate_python_module,
-    print_usage_example,
-)
+#
+# The DWARF, generator and preprocessor modules are imported where they are
+# used, so --help and --version don't pay for loading pyelftools.
 from .logging import logger, setup_logging
 from .output import (
     print_banner,
@@ -25,17 +20,13 @@ from .output import (
     print_section_header,
     print_success,
 )
-from .paths import generate_output_filename, strip_trailing_whitespace_from_file
-from .pkgconfig import PkgConfig
-from .preprocessor import parse_function_pointer_typedefs, process_headers
 
+# Directory separators recognized in --output paths
+_PATH_SEPARATORS = (os.sep, os.altsep) if os.altsep else (os.sep,)
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="pybindlib",
-        description="Generate Python ctypes bindings from shared libraries",
-        epilog="""
+# Help text for the argument parser
+_DESCRIPTION = "Generate Python ctypes bindings from shared libraries"
+_EPILOG = """
 Examples:
   # Using explicit library path:
   %(prog)s /usr/lib/libfreerdp.so.3
@@ -50,7 +41,19 @@ Examples:
   %(prog)s --output ./output/ /path/to/library.so
   %(prog)s --output output/bindings.py /path/to/library.so
   %(prog)s ./libone.so ./libtwo.so
-        """,
+  %(prog)s --jobs 4 --output ./output/ ./libone.so ./libtwo.so
+"""
+
+# Argument parser, built on first use by _get_parser()
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="pybindlib",
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -91,6 +94,21 @@ Examples:
         help="Disable progress animation for scripting environments",
     )
 
+    parser.add_argument(
+        "--no-strip",
+        action="store_true",
+        help="Do not strip trailing whitespace from the generated module",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of libraries to process in parallel (default: 1)",
+    )
+
     parser.add_argument(
         "--headers",
         metavar="HEADER_FILE",
@@ -123,15 +141,202 @@ Use with --headers to specify which header files to process.""",
 
     parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
 
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the command line argument parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = _get_parser()
     args = parser.parse_args()
 
     # Validate that we have library paths if not using pkgconfig
     if not args.pkgconfig and not args.library_paths:
         parser.error("At least one library path is required when not using --pkgconfig")
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     return args
 
 
+def _process_library(
+    library_path: str,
+    output: str | None,
+    output_directory: str | None,
+    macros_from_headers: dict[str, str],
+    function_pointer_typedefs_from_headers: set[str],
+    skip_typedefs: bool,
+    skip_progress: bool,
+    strip_whitespace: bool,
+    use_color: bool,
+) -> str:
+    """
+    Generate bindings for a single library.
+
+    Args:
+        library_path: Path to the shared library or debug file
+        output: Output file path, if --output names a file
+        output_directory: Directory to place the generated module in, if
+            --output names a directory
+        macros_from_headers: Macro definitions extracted from headers
+        function_pointer_typedefs_from_headers: Function-pointer typedef names
+            found in headers
+        skip_typedefs: Whether to skip typedefs
+        skip_progress: Whether to disable the progress animation
+        strip_whitespace: Whether to strip trailing whitespace from the
+            generated module
+        use_color: Whether to use colored output
+
+    Returns:
+        Path of the generated module
+    """
+    from .debug_info import (
+        QualityScore,
+        TypedefInfo,
+        collect_all_structures_and_typedefs,
+        load_library_and_debug_info,
+    )
+    from .generator import generate_python_module, print_usage_example
+    from .paths import (
+        generate_output_filename,
+        strip_trailing_whitespace_from_file,
+    )
+
+    print()
+    print_section_header("Loading Library", use_color=use_color)
+    logger.info(f"Loading library: {library_path}")
+    (
+        debug_files,
+        library_name,
+        debug_file_path,
+        build_id,
+        exported_functions,
+    ) = load_library_and_debug_info(library_path)
+
+    print_file_info("Library name", library_name, use_color=use_color)
+    print_file_info("Build ID", build_id or "unknown", use_color=use_color)
+    print_file_info("Debug file", debug_file_path, use_color=use_color)
+
+    # Show information about the debug files found
+    if debug_files.main_file:
+        logger.debug("Main debuginfo file: %s", debug_files.main_file.file_path)
+    if debug_files.has_auxiliary():
+        print_file_info(
+            "Auxiliary debuginfo file",
+            debug_files.auxiliary_file.file_path,
+            use_color=use_color,
+        )
+        logger.debug(
+            "Auxiliary file: %s", debug_files.auxiliary_file.file_path
+        )
+
+    print()
+    print_section_header("Analyzing Debug Information", use_color=use_color)
+    all_structures, all_typedefs = collect_all_structures_and_typedefs(
+        debug_files, skip_progress=skip_progress
+    )
+
+    # Filter/augment typedefs
+    if skip_typedefs:
+        all_typedefs = {}
+        logger.debug("Skipping typedefs per --skip-typedefs option")
+    elif function_pointer_typedefs_from_headers:
+        added = 0
+        for typedef_name in function_pointer_typedefs_from_headers:
+            if typedef_name not in all_typedefs:
+                all_typedefs[typedef_name] = TypedefInfo(
+                    representation="c_void_p",
+                    quality_score=QualityScore(base_score=4, size_score=1),
+                    description="pointer to function type",
+                )
+                added += 1
+        logger.debug("Added %d function-pointer typedefs from headers", added)
+
+    # Determine output filename for this library
+    if output_directory:
+        generated_filename = generate_output_filename(
+            library_name, library_path
+        )
+        output_filename = os.path.join(output_directory, generated_filename)
+        logger.debug("Output is directory, using: %s", output_filename)
+    elif output:
+        output_filename = output
+    else:
+        output_filename = generate_output_filename(library_name, library_path)
+
+    print()
+    print_section_header("Generating Python Module", use_color=use_color)
+    logger.info(f"Generating {output_filename}...")
+    generate_python_module(
+        output_filename,
+        library_name,
+        build_id,
+        all_structures,
+        all_typedefs,
+        exported_functions,
+        macros_from_headers,
+    )
+
+    # Strip any trailing whitespace in the generated file
+    if strip_whitespace:
+        strip_trailing_whitespace_from_file(output_filename)
+
+    # Success summary
+    print_success(
+        f"Successfully generated {output_filename}", use_color=use_color
+    )
+
+    # Print usage example with discovered real function and struct names
+    print_usage_example(
+        debug_files,
+        all_structures,
+        all_typedefs,
+        output_filename,
+        use_color=use_color,
+    )
+
+    return output_filename
+
+
+def _process_library_in_worker(verbose: bool, **process_kwargs) -> str:
+    """
+    Run _process_library() in a worker process.
+
+    Console output is captured rather than written directly, so output from
+    concurrently processed libraries does not interleave.
+
+    Args:
+        verbose: Enable verbose logging output
+        process_kwargs: Keyword arguments for _process_library()
+
+    Returns:
+        Captured console output
+
+    Raises:
+        Any exception raised by _process_library(), with the console output
+        captured up to that point attached as its ``output`` attribute
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            setup_logging(
+                verbose=verbose, use_color=process_kwargs["use_color"]
+            )
+            _process_library(**process_kwargs)
+    except BaseException as error:
+        error.output = buffer.getvalue()
+        raise
+    return buffer.getvalue()
+
+
 def run_generation_pipeline(args: argparse.Namespace) -> None:
     """
     Execute the complete bindings generation pipeline.
@@ -139,6 +344,9 @@ def run_generation_pipeline(args: argparse.Namespace) -> None:
     Args:
         args: Parsed command line arguments
     """
+    from .pkgconfig import PkgConfig
+    from .preprocessor import parse_function_pointer_typedefs, process_headers
+
     use_color = not args.no_color
 
     # Set up logging
@@ -163,7 +371,7 @@ def run_generation_pipeline(args: argparse.Namespace) -> None:
 
             if args.verbose:
                 for path in pkg_info.get_include_dirs():
-                    logger.debug(f"Include path: {path}")
+                    logger.debug("Include path: %s", path)
 
             # If no library paths provided, try to find them from pkg-config
             if not library_paths:
@@ -226,160 +434,82 @@ def run_generation_pipeline(args: argparse.Namespace) -> None:
                 parse_function_pointer_typedefs(args.headers)
             )
 
-    # Determine output directory behavior for multiple libraries
+    # Determine whether --output names a directory or a file
     multiple_libraries = len(getattr(args, "library_paths", []) or []) > 1
-    output_is_directory_for_multiple = False
     output_directory: str | None = None
-    if args.output and multiple_libraries:
-        # Treat output as directory only; create if necessary
+    if args.output:
         if os.path.isdir(args.output):
-            output_is_directory_for_multiple = True
             output_directory = args.output
+        elif args.output.endswith(_PATH_SEPARATORS):
+            # A path ending with a separator is clearly a directory; create it
+            os.makedirs(args.output, exist_ok=True)
+            output_directory = args.output
+        elif multiple_libraries:
+            raise ValueError(
+                "When multiple libraries are provided, --output must be a "
+                "directory (e.g., './out/')."
+            )
         else:
-            # If the path ends with a path separator, treat as directory and create
-            seps = [os.sep]
-            if os.altsep:
-                seps.append(os.altsep)
-            if any(args.output.endswith(sep) for sep in seps):
-                os.makedirs(args.output, exist_ok=True)
-                output_is_directory_for_multiple = True
-                output_directory = args.output
-            else:
-                raise ValueError(
-                    "When multiple libraries are provided, --output must be a directory (e.g., './out/')."
-                )
+            # Output is a file path; create its parent directories if it has any
+            parent_dir = os.path.dirname(args.output)
+            if parent_dir:
+                logger.debug("Creating parent directories: %s", parent_dir)
+                os.makedirs(parent_dir, exist_ok=True)
 
     # Process each library
-    for library_path in args.library_paths:
-        print()
-        print_section_header("Loading Library", use_color=use_color)
-        logger.info(f"Loading library: {library_path}")
-        (
-            debug_files,
-            library_name,
-            debug_file_path,
-            build_id,
-            exported_functions,
-        ) = load_library_and_debug_info(library_path)
-
-        print_file_info("Library name", library_name, use_color=use_color)
-        print_file_info("Build ID", build_id or "unknown", use_color=use_color)
-        print_file_info("Debug file", debug_file_path, use_color=use_color)
-
-        # Show information about the debug files found
-        if debug_files.main_file:
-            logger.debug(f"Main debuginfo file: {debug_files.main_file.file_path}")
-        if debug_files.has_auxiliary():
-            print_file_info(
-                "Auxiliary debuginfo file",
-                debug_files.auxiliary_file.file_path,
-                use_color=use_color,
-            )
-            logger.debug(
-                f"Auxiliary file: {debug_files.auxiliary_file.file_path}"
-            )
-
-        print()
-        print_section_header("Analyzing Debug Information", use_color=use_color)
-        all_structures, all_typedefs = collect_all_structures_and_typedefs(
-            debug_files, skip_progress=args.skip_progress
+    library_options = {
+        "output": args.output,
+        "output_directory": output_directory,
+        "macros_from_headers": macros_from_headers,
+        "function_pointer_typedefs_from_headers": (
+            function_pointer_typedefs_from_headers
+        ),
+        "skip_typedefs": args.skip_typedefs,
+        "strip_whitespace": not args.no_strip,
+        "use_color": use_color,
+    }
+    jobs = min(args.jobs, len(args.library_paths))
+    if jobs > 1:
+        logger.info(
+            f"Processing {len(args.library_paths)} libraries "
+            f"with {jobs} parallel jobs"
         )
-
-        # Filter/augment typedefs
-        if args.skip_typedefs:
-            all_typedefs = {}
-            logger.debug("Skipping typedefs per --skip-typedefs option")
-        elif function_pointer_typedefs_from_headers:
-            added = 0
-            for typedef_name in function_pointer_typedefs_from_headers:
-                if typedef_name not in all_typedefs:
-                    all_typedefs[typedef_name] = TypedefInfo(
-                        representation="c_void_p",
-                        quality_score=QualityScore(base_score=4, size_score=1),
-                        description="pointer to function type",
-                    )
-                    added += 1
-            logger.debug(
-                f"Added {added} function-pointer typedefs from headers"
-            )
-
-        # Determine output filename for this library
-        if args.output:
-            if multiple_libraries and output_is_directory_for_multiple:
-                generated_filename = generate_output_filename(
-                    library_name, library_path
-                )
-                output_filename = os.path.join(
-                    output_directory, generated_filename
-                )  # type: ignore[arg-type]
-                logger.debug(
-                    f"Output directory (multiple), using: {output_filename}"
-                )
-            elif os.path.isdir(args.output):
-                # If output is a directory, generate filename and place it there
-                generated_filename = generate_output_filename(
-                    library_name, library_path
-                )
-                output_filename = os.path.join(args.output, generated_filename)
-                logger.debug(
-                    f"Output is directory, using: {output_filename}"
-                )
-            else:
-                # If output is a file path (or doesn't exist yet), use it directly
-                output_filename = args.output
-
-                # Auto-create parent directories only when path structure is unambiguous:
-                # - Path ends with directory separator (e.g., "output/") - clearly a directory
-                # - OR path has any directory separators (e.g., "output/file.py", "path/to/file.py")
-                # Skip only the ambiguous case: single component with no separators (e.g., "output")
-                separators = [os.sep]
-                if os.altsep:
-                    separators.append(os.altsep)
-
-                has_separators = any(sep in output_filename for sep in separators)
-
-                if has_separators:
-                    parent_dir = os.path.dirname(output_filename)
-                    if parent_dir and not os.path.exists(parent_dir):
-                        logger.debug(
-                            f"Creating parent directories: {parent_dir}"
-                        )
-                        os.makedirs(parent_dir, exist_ok=True)
-        else:
-            output_filename = generate_output_filename(
-                library_name, library_path
+        from concurrent.futures import ProcessPoolExecutor
+
+        failures: list[tuple[str, BaseException]] = []
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    _process_library_in_worker,
+                    args.verbose,
+                    library_path=library_path,
+                    # The animation can't be shown from a worker process
+                    skip_progress=True,
+                    **library_options,
+                ): library_path
+                for library_path in args.library_paths
+            }
+            # Report results in submission order, so output is deterministic
+            # and one failing library doesn't hide the others
+            for future, library_path in futures.items():
+                try:
+                    print(future.result(), end="")
+                except (Exception, SystemExit) as error:
+                    print(getattr(error, "output", ""), end="")
+                    failures.append((library_path, error))
+
+        if failures:
+            details = "; ".join(f"{path}: {error}" for path, error in failures)
+            first_error = failures[0][1]
+            raise RuntimeError(f"Failed to process {details}") from first_error
+    else:
+        for library_path in args.library_paths:
+            _process_library(
+                library_path=library_path,
+                skip_progress=args.skip_progress,
+                **library_options,
             )
 
-        print()
-        print_section_header("Generating Python Module", use_color=use_color)
-        logger.info(f"Generating {output_filename}...")
-        generate_python_module(
-            output_filename,
-            library_name,
-            build_id,
-            all_structures,
-            all_typedefs,
-            exported_functions,
-            macros_from_headers,
-        )
-
-        # Strip any trailing whitespace in the generated file
-        strip_trailing_whitespace_from_file(output_filename)
-
-        # Success summary
-        print_success(
-            f"Successfully generated {output_filename}", use_color=use_color
-        )
-
-        # Print usage example with discovered real function and struct names
-        print_usage_example(
-            debug_files,
-            all_structures,
-            all_typedefs,
-            output_filename,
-            use_color=use_color,
-        )
-
 
 def main():
     """Main entry point for the CLI."""
@@ -28,6 +28,13 @@ except ImportError:
 # Pattern for removing ANSI color codes when calculating string length
 ANSI_COLOR_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 
+# Color sequences used on every call of the helpers below, combined once
+_SECTION_HEADER_STYLE = Fore.BLUE + Style.BRIGHT
+_LABEL_STYLE = Fore.WHITE + Style.BRIGHT
+_SUCCESS_STYLE = Fore.GREEN + Style.BRIGHT
+_STATUS_FOUND = f"{Fore.GREEN}✓{Style.RESET_ALL}"
+_STATUS_MISSING = f"{Fore.RED}✗{Style.RESET_ALL}"
+
 
 def _strip_ansi(text: str) -> str:
     """Remove ANSI color codes from text."""
@@ -72,7 +79,7 @@ def print_banner(text: str, use_color: bool = True):
 def print_section_header(title: str, use_color: bool = True):
     """Print a formatted section header."""
     if use_color and _has_colorama:
-        print(f"{Fore.BLUE}{Style.BRIGHT}┌─ {title}{Style.RESET_ALL}")
+        print(f"{_SECTION_HEADER_STYLE}┌─ {title}{Style.RESET_ALL}")
     else:
         print(f"── {title}")
 
@@ -82,14 +89,8 @@ def print_file_info(
 ):
     """Print formatted file information."""
     if use_color and _has_colorama:
-        status = (
-            f"{Fore.GREEN}✓{Style.RESET_ALL}"
-            if exists
-            else f"{Fore.RED}✗{Style.RESET_ALL}"
-        )
-        print(
-            f"│  {status} {Fore.WHITE}{Style.BRIGHT}{label}:{Style.RESET_ALL} {path}"
-        )
+        status = _STATUS_FOUND if exists else _STATUS_MISSING
+        print(f"│  {status} {_LABEL_STYLE}{label}:{Style.RESET_ALL} {path}")
     else:
         status = "✓" if exists else "✗"
         print(f"   {status} {label}: {path}")
@@ -98,7 +99,7 @@ def print_file_info(
 def print_success(message: str, use_color: bool = True):
     """Print a success message with formatting."""
     if use_color and _has_colorama:
-        print(f"\n{Fore.GREEN}{Style.BRIGHT}🎉 {message}{Style.RESET_ALL}")
+        print(f"\n{_SUCCESS_STYLE}🎉 {message}{Style.RESET_ALL}")
     else:
         print(f"\n✓ {message}")
 
@@ -8,11 +8,15 @@ consistent and safe manner.
 # Standard library imports
 import os
 import logging
+import tempfile
 from typing import List, Optional
 
 # Global variables
 logger = logging.getLogger("pybindlib")
 
+# Characters in library names that are not valid in Python module names
+_MODULE_NAME_TRANSLATION = str.maketrans({"-": "_", ".": "_", "/": "_"})
+
 
 def resolve_header_path(header_path: str, include_paths: Optional[List[str]] = None) -> str:
     """
@@ -53,7 +57,7 @@ def resolve_header_path(header_path: str, include_paths: Optional[List[str]] = N
 
 
 def generate_output_filename(
-    library_name: str | None, fallback_path: str
+    library_name: str | None, fallback_path: str | bytes | os.PathLike
 ) -> str:
     """
     Generate output filename based on library name.
@@ -67,7 +71,8 @@ def generate_output_filename(
 
     Args:
         library_name: Library name from SONAME
-        fallback_path: Path to use if library_name is None or empty
+        fallback_path: Path to use if library_name is None or empty; may be
+            a str, bytes or path-like object
 
     Returns:
         Generated filename
@@ -75,12 +80,10 @@ def generate_output_filename(
     if library_name and library_name.strip():
         base = library_name
     else:
-        base = os.path.basename(fallback_path)
+        base = os.path.basename(os.fsdecode(fallback_path))
 
     # Convert library name to Python module name
-    base = base.replace("-", "_")
-    base = base.replace(".", "_")
-    base = base.replace("/", "_")
+    base = base.translate(_MODULE_NAME_TRANSLATION)
 
     return f"{base}.py"
 
@@ -91,15 +94,49 @@ def strip_trailing_whitespace_from_file(file_path: str) -> None:
 
     This function ensures consistent file formatting by:
     - Removing trailing spaces and tabs
-    - Ensuring exactly one newline at end of file
+    - Normalizing line endings to LF
+    - Ensuring exactly one newline at end of non-empty files
     - Preserving line content and order
     - Handling encoding correctly
+    - Replacing the file atomically, following symlinks to their target
     - Logging errors without failing
     """
     try:
-        with open(file_path, encoding="utf-8") as file_handle:
-            lines = file_handle.readlines()
-        with open(file_path, "w", encoding="utf-8") as file_handle:
-            file_handle.writelines(line.rstrip() + "\n" for line in lines)
+        # Replace the link target rather than the link itself
+        file_path = os.path.realpath(file_path)
+        with open(file_path, "rb") as file_handle:
+            data = file_handle.read()
+            mode = os.fstat(file_handle.fileno()).st_mode & 0o7777
+        if not data:
+            return
+        stripped_lines = (line.rstrip() for line in data.splitlines())
+        cleaned = b"\n".join(stripped_lines).rstrip() + b"\n"
+
+        # Leave already clean files untouched
+        if cleaned == data:
+            return
+
+        # Write to a sibling temporary file, flush it to disk and rename it
+        # over the original, so neither an interrupted process nor a crash
+        # leaves a truncated module behind
+        directory = os.path.dirname(file_path)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=".pybindlib_", suffix=".tmp"
+        )
+        try:
+            try:
+                file_handle = os.fdopen(file_descriptor, "wb")
+            except BaseException:
+                os.close(file_descriptor)
+                raise
+            with file_handle:
+                file_handle.write(cleaned)
+                file_handle.flush()
+                os.fsync(file_handle.fileno())
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
     except Exception as error:
-        logger.debug(f"Failed to strip whitespace: {error}")
\ No newline at end of file
+        logger.debug(f"Failed to strip whitespace: {error}")
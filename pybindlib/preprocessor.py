@@ -11,6 +11,12 @@ import subprocess
 from .logging import logger
 from .paths import resolve_header_path
 
+# Function-pointer typedefs: typedef <ret> (<cc>* Name) (args...);
+FUNCTION_POINTER_TYPEDEF_PATTERN = re.compile(
+    r"typedef\s+[^;\n]*\(\s*[^)]*\*\s*([A-Za-z_][A-Za-z0-9_]*)\s*\)"
+    r"\s*\([^;]*\)\s*;"
+)
+
 
 def process_headers(
     header_files: list[str],
@@ -234,18 +240,13 @@ def parse_function_pointer_typedefs(header_files: list[str]) -> set[str]:
     if not header_files:
         return fn_typedef_names
 
-    # Regex: typedef <ret> (<cc>* Name) (args...);
-    pattern = re.compile(
-        r"typedef\s+[^;\n]*\(\s*[^)]*\*\s*([A-Za-z_][A-Za-z0-9_]*)\s*\)\s*\([^;]*\)\s*;"
-    )
-
     for path in header_files:
         try:
             # Resolve header path using include paths
             resolved_path = resolve_header_path(path)
             with open(resolved_path, encoding="utf-8", errors="ignore") as fh:
                 text = fh.read()
-                for match in pattern.finditer(text):
+                for match in FUNCTION_POINTER_TYPEDEF_PATTERN.finditer(text):
                     name = match.group(1)
                     if name and name.isidentifier():
                         fn_typedef_names.add(name)
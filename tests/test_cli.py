@@ -3,10 +3,19 @@ Tests for the CLI module.
 """
 
 import os
+import subprocess
+import sys
 import pytest
+from concurrent.futures import Future
 from unittest.mock import patch, MagicMock
 
-from pybindlib.cli import parse_arguments, run_generation_pipeline, main
+from pybindlib.cli import (
+    _process_library_in_worker,
+    main,
+    parse_arguments,
+    run_generation_pipeline,
+)
+from pybindlib.logging import setup_logging
 from pybindlib.pkgconfig import PkgConfigResult
 
 
@@ -19,6 +28,7 @@ def test_parse_arguments_minimal():
         assert not args.no_color
         assert not args.skip_typedefs
         assert not args.skip_progress
+        assert not args.no_strip
         assert args.output is None
         assert args.headers is None
         assert args.modules is None
@@ -57,7 +67,7 @@ def test_parse_arguments_missing_library():
 @pytest.fixture
 def mock_pkgconfig():
     """Mock PkgConfig for testing."""
-    with patch('pybindlib.cli.PkgConfig') as mock:
+    with patch('pybindlib.pkgconfig.PkgConfig') as mock:
         instance = mock.return_value
         result = PkgConfigResult(
             libraries={'freerdp3'},
@@ -87,11 +97,13 @@ def test_run_generation_pipeline_pkgconfig(mock_pkgconfig, temp_dir):
     args.headers = None
     args.modules = None
     args.include_paths = None
+    args.jobs = 1
+    args.no_strip = False
 
     with patch('glob.glob', return_value=[lib_path]), \
-         patch('pybindlib.cli.load_library_and_debug_info') as mock_load, \
-         patch('pybindlib.cli.collect_all_structures_and_typedefs') as mock_collect, \
-         patch('pybindlib.cli.generate_python_module') as mock_gen:
+         patch('pybindlib.debug_info.load_library_and_debug_info') as mock_load, \
+         patch('pybindlib.debug_info.collect_all_structures_and_typedefs') as mock_collect, \
+         patch('pybindlib.generator.generate_python_module') as mock_gen:
 
         mock_load.return_value = (
             MagicMock(),  # debug_files
@@ -153,6 +165,7 @@ def test_parse_arguments_full():
         '--no-color',
         '--skip-typedefs',
         '--skip-progress',
+        '--no-strip',
         '--output', 'output.py',
         '--headers', 'header1.h', 'header2.h',
         '--modules', 'mod1', 'mod2',
@@ -168,19 +181,38 @@ def test_parse_arguments_full():
         assert args.no_color
         assert args.skip_typedefs
         assert args.skip_progress
+        assert args.no_strip
         assert args.output == 'output.py'
         assert args.headers == ['header1.h', 'header2.h']
         assert args.modules == ['mod1', 'mod2']
         assert args.include_paths == ['/include/path1', '/include/path2']
 
 
+def test_parse_arguments_jobs():
+    """Test parsing and validation of --jobs."""
+    with patch('sys.argv', ['pybindlib', '/path/to/library.so']):
+        assert parse_arguments().jobs == 1
+
+    with patch('sys.argv', ['pybindlib', '-j', '4', 'a.so', 'b.so']):
+        assert parse_arguments().jobs == 4
+
+    with patch('sys.argv', ['pybindlib', '--jobs', '0', 'a.so']), \
+         pytest.raises(SystemExit):
+        parse_arguments()
+
+
 @pytest.mark.parametrize('output_path,expected', [
     ('output.py', 'output.py'),
     ('output/', 'output/libtest_so.py'),
     ('path/to/output/', 'path/to/output/libtest_so.py'),
 ])
-def test_run_generation_pipeline_output_handling(output_path, expected, temp_dir):
+def test_run_generation_pipeline_output_handling(
+    output_path, expected, temp_dir, monkeypatch
+):
     """Test output path handling in run_generation_pipeline for a single library."""
+    # Relative output paths are created under the temporary directory
+    monkeypatch.chdir(temp_dir)
+
     args = MagicMock()
     single_lib_path = os.path.join(temp_dir, 'libtest.so')
     args.library_paths = [single_lib_path]
@@ -192,13 +224,15 @@ def test_run_generation_pipeline_output_handling(output_path, expected, temp_dir
     args.headers = None
     args.modules = None
     args.include_paths = None
+    args.jobs = 1
+    args.no_strip = False
     args.pkgconfig = None
 
     # Create dummy library file
     with open(single_lib_path, 'wb') as f:
         f.write(b'\x7fELF')  # Minimal ELF header
 
-    with patch('pybindlib.cli.load_library_and_debug_info') as mock_load:
+    with patch('pybindlib.debug_info.load_library_and_debug_info') as mock_load:
         mock_load.return_value = (
             MagicMock(),  # debug_files
             'libtest.so',  # library_name
@@ -207,10 +241,10 @@ def test_run_generation_pipeline_output_handling(output_path, expected, temp_dir
             []  # exported_functions
         )
 
-        with patch('pybindlib.cli.collect_all_structures_and_typedefs') as mock_collect:
+        with patch('pybindlib.debug_info.collect_all_structures_and_typedefs') as mock_collect:
             mock_collect.return_value = ({}, {})  # structures, typedefs
 
-            with patch('pybindlib.cli.generate_python_module') as mock_gen:
+            with patch('pybindlib.generator.generate_python_module') as mock_gen:
                 run_generation_pipeline(args)
 
                 # Verify output directory was created if needed
@@ -236,6 +270,8 @@ def test_run_generation_pipeline_multiple_libraries_output_dir(temp_dir):
     args.headers = None
     args.modules = None
     args.include_paths = None
+    args.jobs = 1
+    args.no_strip = False
     args.pkgconfig = None
 
     # Create dummy library files
@@ -243,15 +279,15 @@ def test_run_generation_pipeline_multiple_libraries_output_dir(temp_dir):
         with open(p, 'wb') as f:
             f.write(b'\x7fELF')
 
-    with patch('pybindlib.cli.load_library_and_debug_info') as mock_load:
+    with patch('pybindlib.debug_info.load_library_and_debug_info') as mock_load:
         # Vary library_name for each call
         mock_load.side_effect = [
             (MagicMock(), 'libone.so', None, None, []),
             (MagicMock(), 'libtwo.so', None, None, []),
         ]
-        with patch('pybindlib.cli.collect_all_structures_and_typedefs') as mock_collect:
+        with patch('pybindlib.debug_info.collect_all_structures_and_typedefs') as mock_collect:
             mock_collect.return_value = ({}, {})
-            with patch('pybindlib.cli.generate_python_module') as mock_gen:
+            with patch('pybindlib.generator.generate_python_module') as mock_gen:
                 run_generation_pipeline(args)
 
                 # Verify output directory was created
@@ -266,6 +302,168 @@ def test_run_generation_pipeline_multiple_libraries_output_dir(temp_dir):
                          for name in called_outputs)
 
 
+def test_process_library_in_worker_captures_output(temp_dir):
+    """Worker processes return their console output instead of printing it."""
+    lib_path = os.path.join(temp_dir, 'libtest.so')
+
+    with patch('pybindlib.debug_info.load_library_and_debug_info') as mock_load, \
+         patch('pybindlib.debug_info.collect_all_structures_and_typedefs') as mock_collect, \
+         patch('pybindlib.generator.generate_python_module') as mock_gen:
+        mock_load.return_value = (MagicMock(), 'libtest.so', None, None, [])
+        mock_collect.return_value = ({}, {})
+
+        try:
+            output = _process_library_in_worker(
+                False,
+                library_path=lib_path,
+                output=None,
+                output_directory=temp_dir,
+                macros_from_headers={},
+                function_pointer_typedefs_from_headers=set(),
+                skip_typedefs=False,
+                skip_progress=True,
+                strip_whitespace=True,
+                use_color=False,
+            )
+        finally:
+            setup_logging(verbose=False, use_color=False)
+
+    assert mock_gen.call_args.args[0] == os.path.join(temp_dir, 'libtest_so.py')
+    assert f"Loading library: {lib_path}" in output
+    assert "Successfully generated" in output
+
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs tasks in this process."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
+def _pipeline_args(library_paths, output, jobs=2, no_strip=False):
+    args = MagicMock()
+    args.library_paths = library_paths
+    args.output = output
+    args.no_color = True
+    args.verbose = False
+    args.skip_progress = True
+    args.skip_typedefs = False
+    args.headers = None
+    args.modules = None
+    args.include_paths = None
+    args.jobs = jobs
+    args.no_strip = no_strip
+    args.pkgconfig = None
+    return args
+
+
+def test_run_generation_pipeline_parallel(temp_dir, capsys):
+    """With --jobs > 1, libraries run in workers and are reported in order."""
+    lib1 = os.path.join(temp_dir, 'libone.so')
+    lib2 = os.path.join(temp_dir, 'libtwo.so')
+    args = _pipeline_args([lib1, lib2], os.path.join(temp_dir, 'out/'))
+
+    def load(library_path):
+        if library_path == lib1:
+            raise ValueError("Magic number does not match")
+        return (MagicMock(), 'libtwo.so', None, None, [])
+
+    with patch('concurrent.futures.ProcessPoolExecutor', _InlineExecutor), \
+         patch('pybindlib.debug_info.load_library_and_debug_info',
+               side_effect=load), \
+         patch('pybindlib.debug_info.collect_all_structures_and_typedefs',
+               return_value=({}, {})), \
+         patch('pybindlib.generator.generate_python_module') as mock_gen:
+        try:
+            with pytest.raises(RuntimeError) as exc_info:
+                run_generation_pipeline(args)
+        finally:
+            setup_logging(verbose=False, use_color=False)
+
+    # The failing library is named, and the other library was still generated
+    assert f"{lib1}: Magic number does not match" in str(exc_info.value)
+    called_outputs = [call.args[0] for call in mock_gen.call_args_list]
+    assert called_outputs == [os.path.join(temp_dir, 'out', 'libtwo_so.py')]
+
+    # Output from both workers is printed, in submission order
+    output = capsys.readouterr().out
+    assert output.index(f"Loading library: {lib1}") < output.index(
+        f"Loading library: {lib2}"
+    )
+    assert "Successfully generated" in output
+
+
+def test_run_generation_pipeline_parallel_worker_errors(temp_dir, capsys):
+    """Errors from worker processes name the library that failed."""
+    lib1 = os.path.join(temp_dir, 'libone.so')
+    lib2 = os.path.join(temp_dir, 'libtwo.so')
+    for path in [lib1, lib2]:
+        with open(path, 'wb') as f:
+            f.write(b'not an ELF file')
+    args = _pipeline_args([lib1, lib2], os.path.join(temp_dir, 'out/'))
+
+    with pytest.raises(RuntimeError) as exc_info:
+        run_generation_pipeline(args)
+
+    message = str(exc_info.value)
+    assert f"{lib1}: " in message
+    assert f"{lib2}: " in message
+
+    # Output captured in the workers before they failed is still shown
+    output = capsys.readouterr().out
+    assert f"Loading library: {lib1}" in output
+    assert f"Loading library: {lib2}" in output
+
+
+
+@pytest.mark.parametrize('no_strip', [False, True])
+def test_run_generation_pipeline_no_strip(no_strip, temp_dir):
+    """--no-strip skips the trailing-whitespace pass on the generated module."""
+    args = _pipeline_args(
+        [os.path.join(temp_dir, 'libtest.so')],
+        os.path.join(temp_dir, 'bindings.py'),
+        jobs=1,
+        no_strip=no_strip,
+    )
+
+    with patch('pybindlib.debug_info.load_library_and_debug_info',
+               return_value=(MagicMock(), 'libtest.so', None, None, [])), \
+         patch('pybindlib.debug_info.collect_all_structures_and_typedefs',
+               return_value=({}, {})), \
+         patch('pybindlib.generator.generate_python_module'), \
+         patch('pybindlib.paths.strip_trailing_whitespace_from_file') as mock_strip:
+        run_generation_pipeline(args)
+
+    if no_strip:
+        mock_strip.assert_not_called()
+    else:
+        mock_strip.assert_called_once_with(args.output)
+
+def test_import_does_not_load_debug_info():
+    """Importing the CLI should not load the DWARF parsing modules."""
+    code = (
+        "import sys, pybindlib.cli; "
+        "sys.exit('pybindlib.debug_info' in sys.modules "
+        "or 'elftools' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    assert result.returncode == 0
+
+
 def test_main_keyboard_interrupt():
     """Test handling of KeyboardInterrupt in main()."""
     with patch('pybindlib.cli.parse_arguments', side_effect=KeyboardInterrupt):
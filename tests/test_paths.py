@@ -3,8 +3,9 @@ Tests for path handling utilities.
 """
 
 import os
+import pathlib
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, mock_open
 
 from pybindlib.paths import (
     generate_output_filename,
@@ -23,6 +24,10 @@ def test_generate_output_filename():
     # Test with None library name (should use fallback path)
     assert generate_output_filename(None, "/path/to/libtest.so") == "libtest_so.py"
     assert generate_output_filename(None, "libtest.so") == "libtest_so.py"
+    assert (
+        generate_output_filename(None, "/path/to/lib-test.so.1")
+        == "lib_test_so_1.py"
+    )
 
     # Test special characters
     assert generate_output_filename("lib-test-1.2.3.so", "/path/to/lib") == "lib_test_1_2_3_so.py"
@@ -31,6 +36,30 @@ def test_generate_output_filename():
     # Test empty library name
     assert generate_output_filename("", "/path/to/libtest.so") == "libtest_so.py"
 
+    # Test path-like and bytes fallback paths
+    library_path = pathlib.Path("/path/to/libtest.so")
+    assert generate_output_filename(None, library_path) == "libtest_so.py"
+    assert generate_output_filename(None, bytes(library_path)) == "libtest_so.py"
+
+
+class _UnhashablePath:
+    """Path-like object that defines __eq__ without __hash__."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __fspath__(self):
+        return self.path
+
+    def __eq__(self, other):
+        return isinstance(other, _UnhashablePath) and other.path == self.path
+
+
+def test_generate_output_filename_unhashable_path():
+    """Test that path-like fallback paths need not be hashable."""
+    path = _UnhashablePath("/path/to/libtest.so")
+    assert generate_output_filename(None, path) == "libtest_so.py"
+
 
 def test_resolve_header_path_absolute():
     """Test resolving absolute header paths."""
@@ -145,7 +174,7 @@ def test_strip_trailing_whitespace_error_handling():
         # Should not raise exception
 
 
-def test_strip_trailing_whitespace_encoding():
+def test_strip_trailing_whitespace_encoding(temp_file):
     """Test handling of different encodings and special characters."""
     test_content = [
         "ASCII line   \n",
@@ -153,24 +182,103 @@ def test_strip_trailing_whitespace_encoding():
         "Line with special chars ñ é ß   \n"
     ]
 
-    # Create a mock file object that properly tracks write calls
-    mock_file = MagicMock()
-    mock_file.write = MagicMock()
-    mock_file.writelines = MagicMock()
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.writelines(test_content)
+
+    strip_trailing_whitespace_from_file(temp_file)
+
+    with open(temp_file, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    assert lines[0] == "ASCII line\n"
+    assert lines[1] == "Unicode line with emoji 😊\n"
+    assert lines[2] == "Line with special chars ñ é ß\n"
+
+
+def test_strip_trailing_whitespace_empty_file(temp_file):
+    """Test that an empty file is left empty."""
+    strip_trailing_whitespace_from_file(temp_file)
+
+    assert os.path.getsize(temp_file) == 0
+
+
+def test_strip_trailing_whitespace_preserves_mode(temp_dir):
+    """Test that the file is replaced atomically with its mode intact."""
+    path = os.path.join(temp_dir, "module.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("x = 1   \n")
+    os.chmod(path, 0o644)
+
+    strip_trailing_whitespace_from_file(path)
+
+    with open(path, "r", encoding="utf-8") as f:
+        assert f.read() == "x = 1\n"
+    assert os.stat(path).st_mode & 0o777 == 0o644
+    assert os.listdir(temp_dir) == ["module.py"]
+
+
+def test_strip_trailing_whitespace_through_symlink(temp_dir):
+    """Test that stripping a symlinked file rewrites the link target."""
+    real_path = os.path.join(temp_dir, "real.py")
+    link_path = os.path.join(temp_dir, "link.py")
+    with open(real_path, "w", encoding="utf-8") as f:
+        f.write("x = 1   \n")
+    os.symlink("real.py", link_path)
+
+    strip_trailing_whitespace_from_file(link_path)
+
+    assert os.path.islink(link_path)
+    with open(real_path, "r", encoding="utf-8") as f:
+        assert f.read() == "x = 1\n"
+
+
+def test_strip_trailing_whitespace_removes_temp_file_on_failure(temp_dir):
+    """Test that the temporary file is removed if the rename fails."""
+    path = os.path.join(temp_dir, "module.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("x = 1   \n")
+
+    with patch("pybindlib.paths.os.replace", side_effect=OSError):
+        strip_trailing_whitespace_from_file(path)
+
+    assert os.listdir(temp_dir) == ["module.py"]
+    with open(path, "r", encoding="utf-8") as f:
+        assert f.read() == "x = 1   \n"
+
+
+def test_strip_trailing_whitespace_closes_descriptor_on_failure(temp_dir):
+    """Test that the temporary file descriptor is closed if fdopen fails."""
+    path = os.path.join(temp_dir, "module.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("x = 1   \n")
+
+    with patch("pybindlib.paths.os.fdopen", side_effect=OSError), \
+         patch("pybindlib.paths.os.close", wraps=os.close) as mock_close:
+        strip_trailing_whitespace_from_file(path)
+
+    mock_close.assert_called_once()
+    assert os.listdir(temp_dir) == ["module.py"]
+
+
+def test_strip_trailing_whitespace_line_endings(temp_file):
+    """Test that line endings are normalized and trailing blank lines removed."""
+    with open(temp_file, "wb") as f:
+        f.write(b"first  \r\nsecond\t\r\n\n\n  \n")
+
+    strip_trailing_whitespace_from_file(temp_file)
+
+    with open(temp_file, "rb") as f:
+        assert f.read() == b"first\nsecond\n"
 
-    # Mock both read and write operations
-    mock_open_obj = MagicMock()
-    mock_open_obj.__enter__ = MagicMock(return_value=mock_file)
-    mock_open_obj.__exit__ = MagicMock(return_value=None)
 
-    # Set up the mock to return our test content when reading
-    mock_file.readlines = MagicMock(return_value=test_content)
+def test_strip_trailing_whitespace_clean_file_untouched(temp_file):
+    """Test that a file without trailing whitespace is not rewritten."""
+    with open(temp_file, "wb") as f:
+        f.write(b"x = 1\ny = 2\n")
+    inode = os.stat(temp_file).st_ino
 
-    with patch("builtins.open", return_value=mock_open_obj):
-        strip_trailing_whitespace_from_file("test.txt")
+    with patch("pybindlib.paths.tempfile.mkstemp") as mock_mkstemp:
+        strip_trailing_whitespace_from_file(temp_file)
 
-        # Verify write calls
-        write_calls = list(mock_file.writelines.call_args[0][0])
-        assert write_calls[0] == "ASCII line\n"
-        assert write_calls[1] == "Unicode line with emoji 😊\n"
-        assert write_calls[2] == "Line with special chars ñ é ß\n"
\ No newline at end of file
+    mock_mkstemp.assert_not_called()
+    assert os.stat(temp_file).st_ino == inode